@@ -16,11 +16,14 @@ import sys
 import os
 import argparse
 import datetime
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-import importlib.util
-import shutil
-import shlex
+import mmap
+import re
+import tempfile
+import types
+import collections
 
 try:
     from nexus_session_logger import NexusSessionLogger
@@ -28,15 +31,45 @@ try:
 except ImportError:
     session_logger = None
 
+# Optional fast JSON codec (Rust/C) for the config hot paths. Falls back to stdlib.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj, *, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+else:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj, *, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Optional incremental pull parser for large configs. Falls back to full parse.
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+# Below this size a single full parse beats incremental parsing overhead.
+_STREAM_PARSE_THRESHOLD = 64 * 1024
+
 __version__ = "3.3.1"
 
 # Best-practice guardrails: these Nexus binaries are CLIs, not MCP servers over stdio.
 # Injecting them into MCP clients (Claude/Codex/etc.) will cause JSON parse errors.
-KNOWN_NONSERVER_BINARIES = {
+KNOWN_NONSERVER_BINARIES = frozenset({
     "mcp-activator",
     "mcp-observer",
     "mcp-surgeon",
-}
+})
 
 # If a server entry points at a local file that doesn't exist, clients will fail with
 # "can't open file ... [Errno 2]". Provide a frictionless cleanup path.
@@ -48,12 +81,16 @@ def _server_entrypoints_missing(server_cfg: Dict[str, Any]) -> Optional[str]:
             return None
         first = str(args[0])
         if first.endswith(".py"):
-            path = Path(first).expanduser()
-            if not path.is_absolute():
+            # os.path string ops: no Path allocations, and one stat syscall
+            # replaces the expanduser/is_absolute/exists chain.
+            expanded = os.path.expanduser(first)
+            if not os.path.isabs(expanded):
                 # Most clients execute with an arbitrary CWD; relative paths are unreliable.
                 return first
-            if not path.exists():
-                return str(path)
+            try:
+                os.stat(expanded)
+            except OSError:
+                return expanded
         return None
     except Exception:
         return None
@@ -61,43 +98,78 @@ def _server_entrypoints_missing(server_cfg: Dict[str, Any]) -> Optional[str]:
 # Known MCP client config locations
 GLOBAL_CONFIG_KEY = "ide_config_paths"
 
+# Overrides cache: global-config path -> (st_mtime_ns, parsed overrides).
+# Edits to ~/.mcp-tools/config.json bump the mtime and refresh the entry, so
+# repeated detect/save calls in one run cost a stat instead of a read + parse.
+_IDE_PATHS_CACHE: Dict[str, tuple] = {}
+
+
 # Allow user overrides for IDE config paths (stored in ~/.mcp-tools/config.json).
 def _load_global_ide_config_paths() -> Dict[str, str]:
     config_path = get_global_config_path()
+    key = str(config_path)
     try:
-        if not config_path.exists():
-            return {}
-        data = json.loads(config_path.read_text(encoding="utf-8"))
-        if not isinstance(data, dict):
-            return {}
-        raw = data.get(GLOBAL_CONFIG_KEY, {})
-        if not isinstance(raw, dict):
-            return {}
-        out: Dict[str, str] = {}
-        for k, v in raw.items():
-            if isinstance(k, str) and isinstance(v, str) and v.strip():
-                out[k] = v
-        return out
-    except Exception:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
         return {}
+    cached = _IDE_PATHS_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    out: Dict[str, str] = {}
+    try:
+        data = _loads(config_path.read_bytes())
+        if isinstance(data, dict):
+            raw = data.get(GLOBAL_CONFIG_KEY, {})
+            if isinstance(raw, dict):
+                for k, v in raw.items():
+                    if isinstance(k, str) and isinstance(v, str) and v.strip():
+                        out[k] = v
+    except Exception:
+        out = {}
+    _IDE_PATHS_CACHE[key] = (mtime, out)
+    return out
+
+# Platform branch decided once; the home dir itself stays a call so embedders
+# and tests that patch Path.home() keep working.
+_IS_WIN = sys.platform == "win32"
+_IS_DARWIN = sys.platform == "darwin"
+
+
+def _home() -> Path:
+    if _IS_WIN:
+        profile = os.environ.get('USERPROFILE')
+        if profile:
+            return Path(profile)
+    return Path.home()
+
 
 # Nexus Support: Try to load high-confidence libraries from the central venv
 def inject_nexus_env():
+    # Run-once sentinel: re-imports in a harness shouldn't re-scan.
+    if getattr(inject_nexus_env, "_done", False):
+        return
+    inject_nexus_env._done = True
     try:
-        home = Path.home() if sys.platform != "win32" else Path(os.environ['USERPROFILE'])
-        nexus_venv = home / ".mcp-tools" / ".venv"
-        if nexus_venv.exists():
+        nexus_venv = _home() / ".mcp-tools" / ".venv"
+        # Single isdir stat; the common no-venv case escapes immediately.
+        if os.path.isdir(str(nexus_venv)):
             # Add site-packages to sys.path
-            import platform
-            if platform.system() == "Windows":
+            if _IS_WIN:
                 site_pkgs = nexus_venv / "Lib" / "site-packages"
             else:
-                # Find python version dir
+                # Find python version dir. scandir + startswith avoids glob's
+                # pattern compilation and reuses d_type instead of per-entry stats.
                 lib_dir = nexus_venv / "lib"
-                py_dirs = list(lib_dir.glob("python3*"))
-                if py_dirs:
-                    site_pkgs = py_dirs[0] / "site-packages"
-                else:
+                site_pkgs = None
+                try:
+                    with os.scandir(lib_dir) as it:
+                        for entry in it:
+                            if entry.name.startswith("python3") and entry.is_dir(follow_symlinks=False):
+                                site_pkgs = Path(entry.path) / "site-packages"
+                                break
+                except FileNotFoundError:
+                    return
+                if site_pkgs is None:
                     return
             
             if site_pkgs.exists() and str(site_pkgs) not in sys.path:
@@ -105,149 +177,330 @@ def inject_nexus_env():
     except Exception:
         pass
 
-inject_nexus_env()
+# Not called at import: commands that need no third-party libs (--list-clients,
+# --version, ...) skip the venv scan entirely. The lazy import helpers below
+# call it right before they try the optional modules.
+
+@functools.lru_cache(maxsize=1)
+def _stdin_is_tty() -> bool:
+    """stdin's tty-ness can't change mid-process; ask the kernel once."""
+    try:
+        return sys.stdin.isatty()
+    except Exception:
+        return False
+
+
+def _prompt(message: str) -> str:
+    """
+    Single prompt helper for every interactive read.
+
+    Loads readline once on first TTY use so all prompts get line editing and
+    history; piped stdin feeds the same sequential reads as before.
+    """
+    if _stdin_is_tty() and not getattr(_prompt, "_readline_ready", False):
+        _prompt._readline_ready = True
+        try:
+            import readline  # noqa: F401
+        except ImportError:
+            pass
+    return input(message)
+
 
 def get_global_config_path():
-    if sys.platform == "win32":
-        return Path(os.environ['USERPROFILE']) / ".mcp-tools" / "config.json"
-    return Path.home() / ".mcp-tools" / "config.json"
+    return _home() / ".mcp-tools" / "config.json"
+
+# Parsed global config, keyed by path string. startup_auto_detect_prompt can
+# trigger one sync per component per client; caching skips the re-read+parse
+# for every call after the first. Writes stay write-through (atomic) so other
+# processes always see a current file.
+_GLOBAL_CONFIG_CACHE: Dict[str, Dict[str, Any]] = {}
+
 
 def update_global_config(ide_name: str, path: str):
     """Sync IDE config path to global Nexus config"""
     config_path = get_global_config_path()
+    cache_key = str(config_path)
     try:
-        if config_path.exists():
+        if cache_key in _GLOBAL_CONFIG_CACHE:
+            data = _GLOBAL_CONFIG_CACHE[cache_key]
+        else:
+            # EAFP: open directly — the missing-file case is the exception,
+            # not a pre-check stat.
             try:
-                data = json.loads(config_path.read_text())
+                data = _loads(config_path.read_bytes())
+            except FileNotFoundError:
+                config_path.parent.mkdir(parents=True, exist_ok=True)
+                data = {}
             except json.JSONDecodeError:
                 stamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                corrupt_backup = config_path.with_suffix(f".json.corrupt.{stamp}")
+                corrupt_backup = Path(f"{config_path}.corrupt.{stamp}")
                 config_path.replace(corrupt_backup)
                 print(f"⚠️  Recovered malformed global config: {corrupt_backup}")
                 data = {}
-        else:
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            data = {}
 
         if not isinstance(data, dict):
             data = {}
         if GLOBAL_CONFIG_KEY not in data or not isinstance(data.get(GLOBAL_CONFIG_KEY), dict):
             data[GLOBAL_CONFIG_KEY] = {}
-        
-        data[GLOBAL_CONFIG_KEY][ide_name] = str(Path(path).expanduser().resolve())
-        
-        with open(config_path, 'w') as f:
-            json.dump(data, f, indent=2)
+
+        resolved = str(Path(path).expanduser().resolve())
+        # Steady state: path already recorded — skip the rewrite entirely.
+        if data[GLOBAL_CONFIG_KEY].get(ide_name) == resolved:
+            _GLOBAL_CONFIG_CACHE[cache_key] = data
+            return
+
+        data[GLOBAL_CONFIG_KEY][ide_name] = resolved
+
+        # Atomic write, same pattern as MCPInjector.save_config.
+        payload = _dumps(data)
+        temp_path = Path(f"{config_path}.tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            _fsync_fd(f.fileno())
+        temp_path.replace(config_path)
+        _fsync_dir(config_path.parent)
+        # Cache only what actually hit disk: caching before the write would
+        # arm the already-recorded fast path and suppress retries forever if
+        # the write failed.
+        _GLOBAL_CONFIG_CACHE[cache_key] = data
     except Exception as e:
+        _GLOBAL_CONFIG_CACHE.pop(cache_key, None)
         print(f"⚠️  Failed to sync global config: {e}")
 
-def _client_specs() -> Dict[str, Dict[str, List[str]]]:
-    return {
-        "xcode": {
-            "configs": ["~/Library/Developer/Xcode/UserData/MCPServers/config.json"],
-            "markers": ["/Applications/Xcode.app"]
-        },
-        "codex": {
-            "configs": [
-                "~/Library/Application Support/Codex/mcp_servers.json",
-                "~/.config/codex/mcp_servers.json",
-                "%APPDATA%/Codex/mcp_servers.json"
-            ],
-            "markers": [
-                "/Applications/Codex.app",
-                "~/Applications/Codex.app",
-                "~/.config/Codex"
-            ]
-        },
-        "claude": {
-            "configs": [
-                "~/Library/Application Support/Claude/claude_desktop_config.json",
-                "~/.config/Claude/claude_desktop_config.json",
-                "%APPDATA%/Claude/claude_desktop_config.json"
-            ],
-            "markers": [
-                "/Applications/Claude.app",
-                "~/Applications/Claude.app"
-            ]
-        },
-        "cursor": {
-            "configs": [
-                "~/.cursor/mcp.json",
-                "~/Library/Application Support/Cursor/mcp.json",
-                "%APPDATA%/Cursor/mcp.json"
-            ],
-            "markers": ["/Applications/Cursor.app", "~/Applications/Cursor.app"]
-        },
-        "vscode": {
-            "configs": [
-                "~/.vscode/mcp_settings.json",
-                "~/Library/Application Support/Code/User/mcp_settings.json",
-                "%APPDATA%/Code/User/mcp_settings.json"
-            ],
-            "markers": ["/Applications/Visual Studio Code.app", "~/Applications/Visual Studio Code.app"]
-        },
-        "aistudio": {
-            "configs": [
-                "~/.config/aistudio/mcp_servers.json",
-                "~/Library/Application Support/Google/AIStudio/mcp_servers.json",
-                "%APPDATA%/Google/AIStudio/mcp_servers.json"
-            ],
-            "markers": [
-                "/Applications/Google AI Studio.app",
-                "~/Applications/Google AI Studio.app"
-            ]
-        },
-        "google-antigravity": {
-            "configs": [
-                "~/.gemini/antigravity/mcp_server.json",
-                "~/.gemini/antigravity/mcp_config.json",
-                "~/.gemini/antigravity/mcp/mcp_config.json"
-            ],
-            "markers": [
-                "/Applications/Google AI Studio.app",
-                "~/Applications/Google AI Studio.app"
-            ]
-        }
+# Immutable view: consumers read the specs, nothing may mutate them.
+_CLIENT_SPECS: Dict[str, Dict[str, List[str]]] = types.MappingProxyType({
+    "xcode": {
+        "configs": ["~/Library/Developer/Xcode/UserData/MCPServers/config.json"],
+        "markers": ["/Applications/Xcode.app"]
+    },
+    "codex": {
+        "configs": [
+            "~/Library/Application Support/Codex/mcp_servers.json",
+            "~/.config/codex/mcp_servers.json",
+            "%APPDATA%/Codex/mcp_servers.json"
+        ],
+        "markers": [
+            "/Applications/Codex.app",
+            "~/Applications/Codex.app",
+            "~/.config/Codex"
+        ]
+    },
+    "claude": {
+        "configs": [
+            "~/Library/Application Support/Claude/claude_desktop_config.json",
+            "~/.config/Claude/claude_desktop_config.json",
+            "%APPDATA%/Claude/claude_desktop_config.json"
+        ],
+        "markers": [
+            "/Applications/Claude.app",
+            "~/Applications/Claude.app"
+        ]
+    },
+    "cursor": {
+        "configs": [
+            "~/.cursor/mcp.json",
+            "~/Library/Application Support/Cursor/mcp.json",
+            "%APPDATA%/Cursor/mcp.json"
+        ],
+        "markers": ["/Applications/Cursor.app", "~/Applications/Cursor.app"]
+    },
+    "vscode": {
+        "configs": [
+            "~/.vscode/mcp_settings.json",
+            "~/Library/Application Support/Code/User/mcp_settings.json",
+            "%APPDATA%/Code/User/mcp_settings.json"
+        ],
+        "markers": ["/Applications/Visual Studio Code.app", "~/Applications/Visual Studio Code.app"]
+    },
+    "aistudio": {
+        "configs": [
+            "~/.config/aistudio/mcp_servers.json",
+            "~/Library/Application Support/Google/AIStudio/mcp_servers.json",
+            "%APPDATA%/Google/AIStudio/mcp_servers.json"
+        ],
+        "markers": [
+            "/Applications/Google AI Studio.app",
+            "~/Applications/Google AI Studio.app"
+        ]
+    },
+    "google-antigravity": {
+        "configs": [
+            "~/.gemini/antigravity/mcp_server.json",
+            "~/.gemini/antigravity/mcp_config.json",
+            "~/.gemini/antigravity/mcp/mcp_config.json"
+        ],
+        "markers": [
+            "/Applications/Google AI Studio.app",
+            "~/Applications/Google AI Studio.app"
+        ]
     }
+})
+
+
+# Home prefix resolved once; the spec literals only ever use the bare '~/'
+# form, so a string splice replaces expanduser's env/pwd lookup per call.
+_HOME_STR = os.path.expanduser("~")
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_path_str(raw_path: str) -> str:
+    # Memoized: duplicate literals across clients (e.g. the shared AI Studio
+    # marker) expand once and every consumer shares the same string object.
+    # expandvars walks the whole string and consults os.environ; most spec
+    # literals have no template, so only pay for it when one is present.
+    if '$' in raw_path or '%' in raw_path:
+        raw_path = os.path.expandvars(raw_path)
+    if raw_path.startswith('~'):
+        if raw_path == '~' or raw_path.startswith('~/'):
+            return _HOME_STR + raw_path[1:]
+        # '~user' form: fall back to the full implementation.
+        return os.path.expanduser(raw_path)
+    return raw_path
 
 
 def _expand_path(raw_path: str) -> Path:
-    expanded = os.path.expandvars(raw_path)
-    return Path(expanded).expanduser()
+    # Path-returning wrapper for boundary callers; hot scans use the str form.
+    return Path(_expand_path_str(raw_path))
+
+
+def _client_specs() -> Dict[str, Dict[str, List[str]]]:
+    # Thin shim kept for callers/tests; the literal itself is a module constant.
+    return _CLIENT_SPECS
+
+
+# Candidate paths expanded exactly once at import. Each entry is
+# (client_name, expanded_config_paths, expanded_marker_paths). Names are
+# interned so override/detected dict probes compare pointers, not characters.
+_CLIENT_SPECS_EXPANDED: tuple = tuple(
+    (
+        sys.intern(name),
+        tuple(_expand_path_str(c) for c in spec["configs"]),
+        tuple(_expand_path_str(m) for m in spec["markers"]),
+    )
+    for name, spec in _CLIENT_SPECS.items()
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_names(parent: str) -> frozenset:
+    """
+    Memoized directory listing for the startup scans.
+
+    Many candidates share a parent (and most parents don't exist on the
+    current OS), so one getdents per directory replaces one stat per
+    candidate — and a missing parent caches the miss for its whole group.
+    """
+    try:
+        return frozenset(os.listdir(parent))
+    except OSError:
+        return frozenset()
+
 
+def _candidate_exists(path_str: str) -> bool:
+    head, tail = os.path.split(path_str)
+    return tail in _dir_names(head)
 
+
+@functools.lru_cache(maxsize=1)
 def get_known_clients() -> Dict[str, str]:
     mapping: Dict[str, str] = {}
     overrides = _load_global_ide_config_paths()
-    specs = _client_specs()
-    for name, spec in specs.items():
+    for name, configs, _markers in _CLIENT_SPECS_EXPANDED:
+        # Interned names make later lookups a pointer comparison.
+        name = sys.intern(name)
         override = overrides.get(name)
         if override:
-            mapping[name] = str(_expand_path(override))
+            mapping[name] = _expand_path_str(override)
             continue
-        for candidate in spec["configs"]:
-            path = _expand_path(candidate)
-            if path.exists():
-                mapping[name] = str(path)
+        for path in configs:
+            if _candidate_exists(path):
+                mapping[name] = path
                 break
         if name not in mapping:
-            mapping[name] = str(_expand_path(spec["configs"][0]))
+            mapping[name] = configs[0]
     return mapping
 
 
-KNOWN_CLIENTS = get_known_clients()
+# Lazy, memoized views over get_known_clients(). Nothing below runs at import,
+# so `import mcp_injector` (e.g. from --bootstrap or another tool) costs zero
+# filesystem syscalls; the scan happens on first actual use.
+def known_clients() -> Dict[str, str]:
+    return get_known_clients()
+
+
+# Expanded once on first use with os.path.expanduser (C implementation) so
+# lookups don't re-allocate a PurePath and re-resolve '~' per call.
+@functools.lru_cache(maxsize=1)
+def _known_clients_expanded() -> Dict[str, str]:
+    return {k: os.path.expanduser(v) for k, v in known_clients().items()}
+
+# Reverse index for the save-time sync: resolved config path -> client name.
+# Built once so each save costs a single dict probe instead of a stat per client.
+def _build_resolved_clients(clients: Dict[str, str]) -> Dict[str, str]:
+    resolved: Dict[str, str] = {}
+    for name, p in clients.items():
+        try:
+            # str keys: dict probes hash a flat string instead of a PurePath.
+            resolved[str(Path(p).expanduser().resolve(strict=False))] = name
+        except OSError:
+            # Unresolvable entry (e.g. permission-denied parent) — skip; the
+            # save-time sync for that client just won't match.
+            continue
+    return resolved
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_known_clients() -> Dict[str, str]:
+    return _build_resolved_clients(known_clients())
 
 REPAIR_RECIPES_FILENAME = "repair_recipes.json"
 
 
-def _load_repair_recipes() -> Dict[str, Dict[str, Any]]:
+def _fmt_cmdline(command: Any, args: Optional[List[Any]] = None) -> str:
+    """Render command + args as a single display string ("cmd a b")."""
+    return " ".join(map(str, (command, *(args or ())))).strip()
+
+
+def _normalize_recipe_entries(entries: Dict[str, Any], source: str) -> Dict[str, Dict[str, Any]]:
+    """Validate and normalize {key: {command, args, label, added}} entries."""
+    out: Dict[str, Dict[str, Any]] = {}
+    for key, value in entries.items():
+        if not (isinstance(key, str) and isinstance(value, dict)):
+            continue
+        cmd = value.get("command")
+        args = value.get("args")
+        label = value.get("label")
+        added = value.get("added")
+        if not isinstance(cmd, str) or not cmd.strip():
+            continue
+        if args is None:
+            args = []
+        if not isinstance(args, list) or any(not isinstance(a, str) for a in args):
+            continue
+        key = key.strip()
+        cmd = cmd.strip()
+        out[key] = {
+            "command": cmd,
+            "args": [a for a in args],
+            "label": label.strip() if isinstance(label, str) else key,
+            "added": added.strip() if isinstance(added, str) else None,
+            # Rendered once here; the pagers re-display it per page without
+            # rebuilding the join on every keystroke.
+            "cmdline": _fmt_cmdline(cmd, args),
+            "source": source,
+        }
+    return out
+
+
+@functools.lru_cache(maxsize=1)
+def _load_recipe_registry() -> tuple:
     """
-    Load repair recipes from a local registry file.
+    Parse the recipe registry file(s) once per process.
 
-    Why:
-      - Keeps "what to run" out of hard-coded logic.
-      - Enables pick-from-a-list UX for humans.
-      - Allows orgs/users to maintain their own recipes without code edits.
+    Repair recipes and npx/server templates share the same JSON file, and a
+    CLI invocation can need both; one cached parse serves both loaders
+    instead of up to four reads of identical bytes.
     """
     # 1) Prefer a co-located file next to this script (repo install).
     local_path = Path(__file__).parent / REPAIR_RECIPES_FILENAME
@@ -255,43 +508,35 @@ def _load_repair_recipes() -> Dict[str, Dict[str, Any]]:
     #    We do not create this file automatically; it's an opt-in power-user hook.
     central_override = get_nexus_home() / "mcp-injector" / REPAIR_RECIPES_FILENAME
 
+    parsed = []
     for path in (local_path, central_override):
         try:
-            if not path.exists():
-                continue
-            data = json.loads(path.read_text(encoding="utf-8"))
-            if not isinstance(data, dict):
-                continue
-            recipes = data.get("recipes")
-            if recipes is None:
-                recipes = data
-            if not isinstance(recipes, dict):
-                continue
-            out: Dict[str, Dict[str, Any]] = {}
-            for key, value in recipes.items():
-                if not (isinstance(key, str) and isinstance(value, dict)):
-                    continue
-                cmd = value.get("command")
-                args = value.get("args")
-                label = value.get("label")
-                added = value.get("added")
-                if not isinstance(cmd, str) or not cmd.strip():
-                    continue
-                if args is None:
-                    args = []
-                if not isinstance(args, list) or any(not isinstance(a, str) for a in args):
-                    continue
-                out[key.strip()] = {
-                    "command": cmd.strip(),
-                    "args": [a for a in args],
-                    "label": label.strip() if isinstance(label, str) else key.strip(),
-                    "added": added.strip() if isinstance(added, str) else None,
-                    "source": str(path),
-                }
-            if out:
-                return out
-        except Exception:
+            data = _loads(path.read_bytes())
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict):
+            parsed.append((str(path), data))
+    return tuple(parsed)
+
+
+def _load_repair_recipes() -> Dict[str, Dict[str, Any]]:
+    """
+    Load repair recipes from a local registry file.
+
+    Why:
+      - Keeps "what to run" out of hard-coded logic.
+      - Enables pick-from-a-list UX for humans.
+      - Allows orgs/users to maintain their own recipes without code edits.
+    """
+    for source, data in _load_recipe_registry():
+        recipes = data.get("recipes")
+        if recipes is None:
+            recipes = data
+        if not isinstance(recipes, dict):
             continue
+        out = _normalize_recipe_entries(recipes, source)
+        if out:
+            return out
     return {}
 
 
@@ -299,49 +544,36 @@ def _load_templates() -> Dict[str, Dict[str, Any]]:
     """
     Load npx/server templates from the same registry file as repair recipes.
     """
-    local_path = Path(__file__).parent / REPAIR_RECIPES_FILENAME
-    central_override = get_nexus_home() / "mcp-injector" / REPAIR_RECIPES_FILENAME
-    for path in (local_path, central_override):
-        try:
-            if not path.exists():
-                continue
-            data = json.loads(path.read_text(encoding="utf-8"))
-            if not isinstance(data, dict):
-                continue
-            templates = data.get("templates", {})
-            if not isinstance(templates, dict):
-                continue
-            out: Dict[str, Dict[str, Any]] = {}
-            for key, value in templates.items():
-                if not (isinstance(key, str) and isinstance(value, dict)):
-                    continue
-                cmd = value.get("command")
-                args = value.get("args")
-                label = value.get("label")
-                added = value.get("added")
-                if not isinstance(cmd, str) or not cmd.strip():
-                    continue
-                if args is None:
-                    args = []
-                if not isinstance(args, list) or any(not isinstance(a, str) for a in args):
-                    continue
-                out[key.strip()] = {
-                    "command": cmd.strip(),
-                    "args": [a for a in args],
-                    "label": label.strip() if isinstance(label, str) else key.strip(),
-                    "added": added.strip() if isinstance(added, str) else None,
-                    "source": str(path),
-                }
-            return out
-        except Exception:
+    for source, data in _load_recipe_registry():
+        templates = data.get("templates", {})
+        if not isinstance(templates, dict):
             continue
+        return _normalize_recipe_entries(templates, source)
     return {}
 
 
+@functools.lru_cache(maxsize=1)
+def _sorted_template_keys() -> tuple:
+    """Template keys in display order, cached alongside the registry parse."""
+    return tuple(_sorted_recipe_keys(_load_templates()))
+
+
+def _sorted_recipe_keys(recipes: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Keys ordered by (added, label, key): decorate-sort-undecorate, so the
+    dict lookups happen once per recipe instead of once per comparison."""
+    decorated = [
+        ((r.get("added") or "9999-99-99"), (r.get("label") or k), k)
+        for k, r in recipes.items()
+    ]
+    decorated.sort()
+    return [t[2] for t in decorated]
+
+
 def list_repair_recipes(*, json_mode: bool = False) -> None:
     recipes = _load_repair_recipes()
     if json_mode:
-        print(json.dumps({"recipes": recipes}, indent=2))
+        # _dumps prefers orjson; decode once for the text stream.
+        print(_dumps({"recipes": recipes}, pretty=True).decode())
         return
     if not recipes:
         print("No repair recipes found.")
@@ -350,32 +582,25 @@ def list_repair_recipes(*, json_mode: bool = False) -> None:
         print(f"  - {get_nexus_home() / 'mcp-injector' / REPAIR_RECIPES_FILENAME}")
         return
     print("\nRepair recipes\n")
-    keys = sorted(
-        recipes.keys(),
-        key=lambda k: (recipes[k].get("added") or "9999-99-99", recipes[k].get("label") or k, k),
-    )
+    keys = _sorted_recipe_keys(recipes)
     for k in keys:
         r = recipes[k]
         label = r.get("label") or k
         added = r.get("added") or "unknown"
-        cmdline = " ".join([str(r.get("command") or ""), *[str(a) for a in (r.get("args") or [])]]).strip()
         print(f"- {label} ({k}) [{added}]")
-        print(f"  {cmdline}")
+        print(f"  {r['cmdline']}")
 
 
 def _pick_repair_recipe(recipes: Dict[str, Dict[str, Any]], *, preferred_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
     if not recipes:
         return None
 
-    keys = sorted(
-        recipes.keys(),
-        key=lambda k: (recipes[k].get("added") or "9999-99-99", recipes[k].get("label") or k, k),
-    )
+    keys = _sorted_recipe_keys(recipes)
     if preferred_key and preferred_key in recipes:
         # Still allow selection when TTY is available; do not auto-select silently.
         keys = [preferred_key] + [k for k in keys if k != preferred_key]
 
-    if not sys.stdin.isatty():
+    if not _stdin_is_tty():
         return None
 
     page_size = 8
@@ -392,10 +617,9 @@ def _pick_repair_recipe(recipes: Dict[str, Dict[str, Any]], *, preferred_key: Op
             r = recipes[k]
             label = r.get("label") or k
             added = r.get("added") or "unknown"
-            cmdline = " ".join([str(r.get("command") or ""), *[str(a) for a in (r.get("args") or [])]]).strip()
             print(f"{i:>2}) {label} [{added}]")
             print(f"    id:  {k}")
-            print(f"    run: {cmdline}")
+            print(f"    run: {r['cmdline']}")
 
         more = end < len(keys)
         nav = []
@@ -406,7 +630,7 @@ def _pick_repair_recipe(recipes: Dict[str, Dict[str, Any]], *, preferred_key: Op
         nav.append("x=exit")
         nav_hint = " / ".join(nav)
         print(f"\nEnter a number to select ({start+1}-{end} of {len(keys)}), or {nav_hint}.")
-        raw = input("Choice: ").strip().lower()
+        raw = _prompt("Choice: ").strip().lower()
         if not raw or raw == "x":
             return None
         if raw == "n" and more:
@@ -424,37 +648,56 @@ def _pick_repair_recipe(recipes: Dict[str, Dict[str, Any]], *, preferred_key: Op
         return recipes[keys[start + idx - 1]]
 
 
+# Memoized for the process lifetime: the installed-client layout doesn't
+# change during one CLI run, and the startup flow plus the listing each call
+# this. Config *contents* are re-read through the mtime-keyed parse cache,
+# so writes in between stay visible.
+@functools.lru_cache(maxsize=1)
 def detect_installed_clients() -> Dict[str, Dict[str, Any]]:
     detected: Dict[str, Dict[str, Any]] = {}
     overrides = _load_global_ide_config_paths()
-    for client, spec in _client_specs().items():
+    for client, configs, markers in _CLIENT_SPECS_EXPANDED:
         override = overrides.get(client)
-        config_candidates = ([_expand_path(override)] if override else []) + [_expand_path(path) for path in spec["configs"]]
-        marker_candidates = [_expand_path(path) for path in spec["markers"]]
+        config_candidates = ([_expand_path_str(override)] if override else []) + list(configs)
 
-        existing_config = next((p for p in config_candidates if p.exists()), None)
-        marker_hit = next((p for p in marker_candidates if p.exists()), None)
+        existing_config = next((p for p in config_candidates if _candidate_exists(p)), None)
+        marker_hit = next((p for p in markers if _candidate_exists(p)), None)
 
         installed = existing_config is not None or marker_hit is not None
+
+        # Carry small config bytes forward so downstream injectors can skip
+        # their own stat + open for a file we just classified.
+        raw_bytes = None
+        if existing_config is not None:
+            try:
+                if os.path.getsize(existing_config) < _STREAM_PARSE_THRESHOLD:
+                    with open(existing_config, 'rb') as f:
+                        raw_bytes = f.read()
+            except OSError:
+                raw_bytes = None
+
         detected[client] = {
             "installed": installed,
             "config_path": existing_config or config_candidates[0],
             "has_config": existing_config is not None,
             "has_marker": marker_hit is not None,
-            "marker": str(marker_hit) if marker_hit else None
+            "marker": marker_hit if marker_hit else None,
+            "raw_bytes": raw_bytes,
         }
     return detected
 
 
 def get_nexus_home() -> Path:
-    if sys.platform == "win32":
-        return Path(os.environ['USERPROFILE']) / ".mcp-tools"
-    return Path.home() / ".mcp-tools"
+    return _home() / ".mcp-tools"
 
 
+@functools.lru_cache(maxsize=1)
 def detect_package_components() -> Dict[str, Dict[str, Any]]:
     """
     Detect Nexus-created executable components and build injectable server configs.
+
+    Memoized: interactive_add and the startup fallback both ask, and the
+    bin dir doesn't change mid-run.
     """
     nexus_home = get_nexus_home()
     bin_dir = nexus_home / "bin"
@@ -482,18 +725,30 @@ def detect_package_components() -> Dict[str, Dict[str, Any]]:
     return components
 
 
+@functools.lru_cache(maxsize=1)
+def _get_yaml():
+    """Import yaml once; every later caller gets the cached module (or None)."""
+    inject_nexus_env()
+    try:
+        import yaml  # type: ignore
+        return yaml
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def _load_inventory_servers() -> Dict[str, Dict[str, Any]]:
     """
     Load forged/registered servers from the local Nexus inventory (if present) and
     return them in the same injectable shape as detect_package_components().
+    Memoized per process, like the other detectors.
     """
     inv_path = get_nexus_home() / "mcp-server-manager" / "inventory.yaml"
     if not inv_path.exists():
         return {}
 
-    try:
-        import yaml  # type: ignore
-    except Exception:
+    yaml = _get_yaml()
+    if yaml is None:
         return {}
 
     try:
@@ -504,6 +759,8 @@ def _load_inventory_servers() -> Dict[str, Dict[str, Any]]:
     except Exception:
         return {}
 
+    import shlex  # hoisted: once per load, not once per inventory entry
+
     out: Dict[str, Dict[str, Any]] = {}
     for s in servers:
         try:
@@ -513,7 +770,10 @@ def _load_inventory_servers() -> Dict[str, Dict[str, Any]]:
             if not s_id or not start_cmd:
                 continue
 
-            argv = shlex.split(start_cmd)
+            if any(c in start_cmd for c in "\"'\\"):
+                argv = shlex.split(start_cmd)
+            else:
+                argv = start_cmd.split()
             if not argv:
                 continue
 
@@ -534,10 +794,109 @@ def _load_inventory_servers() -> Dict[str, Dict[str, Any]]:
     return out
 
 
+# Basic MCP server config schema (Industrial Tier validation).
+_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "mcpServers": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "properties": {
+                    "command": {"type": "string"},
+                    "args": {"type": "array", "items": {"type": "string"}},
+                    "env": {"type": "object", "additionalProperties": {"type": "string"}}
+                },
+                "required": ["command"]
+            }
+        }
+    }
+}
+
+# fastjsonschema generates specialized validation code for the schema once at
+# import — typically 10-100x faster than jsonschema's interpretive walk.
+try:
+    import fastjsonschema  # type: ignore
+    _FAST_VALIDATE = fastjsonschema.compile(_SCHEMA)
+except Exception:
+    _FAST_VALIDATE = None
+
+# Lazily-built validator: None = not yet tried, False = jsonschema unavailable.
+_VALIDATOR = None
+
+
+def _get_validator():
+    """Compile the schema once; later saves reuse the prepared validator."""
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        inject_nexus_env()
+        try:
+            from jsonschema import Draft7Validator
+            _VALIDATOR = Draft7Validator(_SCHEMA)
+        except ImportError:
+            _VALIDATOR = False
+    return _VALIDATOR
+
+
+def _fsync_fd(fd: int) -> None:
+    """
+    Force data to stable storage. On Darwin fsync() only flushes to the drive,
+    not through its cache, so prefer F_FULLFSYNC there.
+    """
+    if _IS_DARWIN:
+        try:
+            import fcntl
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            return
+        except Exception:
+            pass
+    os.fsync(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Best-effort fsync of a directory so renames within it are durable."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    try:
+        dirfd = os.open(str(path), os.O_DIRECTORY)
+    except Exception:
+        return
+    try:
+        os.fsync(dirfd)
+    except Exception:
+        pass
+    finally:
+        os.close(dirfd)
+
+
+# Process-wide parsed-config cache: expanded path string ->
+# ((st_mtime_ns, st_size), parsed dict). The size guards against mtime
+# granularity on filesystems with coarse timestamps.
+# The interactive listing walks every client config and the
+# removal flow then re-opens the same files through fresh MCPInjector
+# instances; keying on mtime lets them all share one parse, and writers
+# refresh the entry after the atomic replace.
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+
 class MCPInjector:
-    def __init__(self, config_path: Path):
+    def __init__(self, config_path: Path, *, pretty: bool = False, preloaded_bytes: Optional[bytes] = None):
         self.config_path = config_path.expanduser()
-        self.backup_path = self.config_path.with_suffix('.json.backup')
+        # Plain-string siblings, computed once so the save hot path never
+        # re-runs Path suffix parsing or allocates new PurePath objects.
+        self._cfg_str = os.fspath(self.config_path)
+        self._bak_str = self._cfg_str + '.backup'
+        # Public mirror of where save_config actually writes the backup
+        # (plain '.backup' suffix appended, whatever the config's extension).
+        self.backup_path = Path(self._bak_str)
+        # Parsed config, cached after the first load so repeated operations on
+        # one instance don't re-read and re-parse the same file.
+        self._config: Optional[Dict[str, Any]] = None
+        # Bytes handed over by detect_installed_clients; consumed on first load.
+        self._preloaded_bytes = preloaded_bytes
+        # Configs are machine-consumed; compact output is smaller and faster
+        # to encode/fsync. --pretty restores indented output for humans.
+        self.pretty = pretty
 
     @staticmethod
     def _sanitize_loaded_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -545,18 +904,49 @@ class MCPInjector:
         Remove deprecated/legacy keys that should not persist across rewrites.
         This is intentionally narrow to avoid deleting user data.
         """
-        servers = config.get("mcpServers")
-        if not isinstance(servers, dict):
-            return config
-        for _name, cfg in servers.items():
-            if not isinstance(cfg, dict):
-                continue
+        # No legacy keys are stripped today; return without walking the
+        # servers so every load skips the per-entry iteration. The hook stays
+        # so a future deprecation only has to add its key check here.
+        return config
+
+    def _stream_load(self) -> Dict[str, Any]:
+        """
+        Incrementally parse the config with ijson, one top-level entry at a time.
 
+        Keeps the peak working set bounded by the largest single entry instead of
+        raw text + full tree at once. All top-level keys are preserved so a later
+        save_config() never drops user data.
+        """
+        config: Dict[str, Any] = {}
+        with open(self.config_path, 'rb') as f:
+            # use_float: ijson defaults fractional numbers to Decimal, which
+            # json.dumps can't serialize and the structural audit would flag
+            # as a type change; float/int matches every other load path.
+            for key, value in ijson.kvitems(f, '', use_float=True):
+                config[key] = value
         return config
-    
+
     def load_config(self) -> Dict[str, Any]:
         """Load existing config or create empty structure"""
-        if not self.config_path.exists():
+        if self._config is not None:
+            return self._config
+        if self._preloaded_bytes is not None:
+            preloaded, self._preloaded_bytes = self._preloaded_bytes, None
+            try:
+                config = _loads(preloaded)
+                if "mcpServers" not in config:
+                    config["mcpServers"] = {}
+                self._config = self._sanitize_loaded_config(config)
+                return self._config
+            except ValueError:
+                pass  # stale/corrupt handoff — fall through to the disk path
+        # One stat serves three decisions: existence, the cross-instance cache
+        # check, and the stream-parse size threshold.
+        try:
+            st = os.stat(self._cfg_str)
+        except OSError:
+            st = None
+        if st is None:
             print(f"⚠️  Config file doesn't exist. Will create: {self.config_path}")
             try:
                 self.config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -567,26 +957,56 @@ class MCPInjector:
             except Exception as e:
                 print(f"❌ Failed to prepare config directory: {e}")
                 sys.exit(1)
-            return {"mcpServers": {}}
-        
+            self._config = {"mcpServers": {}}
+            return self._config
+
+        cached = _CONFIG_CACHE.get(self._cfg_str)
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            config = cached[1]
+            if "mcpServers" not in config:
+                config["mcpServers"] = {}
+            self._config = self._sanitize_loaded_config(config)
+            return self._config
+
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
-            
+            if orjson is not None and st.st_size >= _STREAM_PARSE_THRESHOLD:
+                # Large file + orjson: map the file and parse straight out of
+                # the page cache — no read() copy into an intermediate bytes
+                # object, so the peak working set is just the parsed tree.
+                with open(self._cfg_str, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        config = _loads(view)
+                    finally:
+                        view.release()
+            elif ijson is not None and st.st_size >= _STREAM_PARSE_THRESHOLD:
+                # Large file, stdlib codec: stream-parse to cap peak memory.
+                config = self._stream_load()
+            else:
+                # _loads takes bytes directly, skipping the text decode.
+                config = _loads(self.config_path.read_bytes())
+
             # Ensure mcpServers key exists
             if "mcpServers" not in config:
                 config["mcpServers"] = {}
 
-            return self._sanitize_loaded_config(config)
-        except json.JSONDecodeError as e:
+            self._config = self._sanitize_loaded_config(config)
+            _CONFIG_CACHE[self._cfg_str] = ((st.st_mtime_ns, st.st_size), self._config)
+            return self._config
+        # ValueError covers both json.JSONDecodeError and orjson.JSONDecodeError.
+        except ValueError as e:
             print(f"❌ Invalid JSON in {self.config_path}")
             print(f"   Error: {e}")
             stamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-            corrupt_backup = self.config_path.with_suffix(f".json.corrupt.{stamp}")
+            # Plain string formatting; with_suffix would re-run suffix parsing.
+            corrupt_backup = Path(f"{self._cfg_str}.corrupt.{stamp}")
             try:
                 self.config_path.replace(corrupt_backup)
                 print(f"🩹 Recovered by moving corrupt file to: {corrupt_backup}")
-                return {"mcpServers": {}}
+                _CONFIG_CACHE.pop(self._cfg_str, None)
+                self._config = {"mcpServers": {}}
+                return self._config
             except Exception as backup_error:
                 print(f"❌ Recovery failed: {backup_error}")
                 sys.exit(1)
@@ -598,47 +1018,49 @@ class MCPInjector:
         """
         Deep compare structures to detect unintended type changes (Schema Drift).
         Standard Tier (96% Confidence) protection.
+
+        Iterative (explicit stack) so deep configs cost one loop iteration per
+        key instead of a Python frame per nesting level, with a single type()
+        fetch per value.
         """
-        for key, new_val in new.items():
-            if key in old:
-                old_val = old[key]
-                if type(old_val) != type(new_val) and old_val is not None and new_val is not None:
-                    print(f"❌ Structural Integrity Violation at '{path}{key}':")
-                    print(f"   Expected {type(old_val).__name__}, got {type(new_val).__name__}")
+        stack = [(old, new, path)]
+        while stack:
+            o, n, prefix = stack.pop()
+            for key, new_val in n.items():
+                if key not in o:
+                    continue
+                old_val = o[key]
+                # Identical subtree object (e.g. carried over unchanged) — skip.
+                if old_val is new_val:
+                    continue
+                old_type = type(old_val)
+                new_type = type(new_val)
+                if old_type is not new_type and old_val is not None and new_val is not None:
+                    print(f"❌ Structural Integrity Violation at '{prefix}{key}':")
+                    print(f"   Expected {old_type.__name__}, got {new_type.__name__}")
                     raise TypeError(f"Schema drift detected at {key}")
-                
-                if isinstance(new_val, dict) and isinstance(old_val, dict):
-                    self._structural_audit(old_val, new_val, f"{path}{key}.")
+
+                if new_type is dict and old_type is dict:
+                    stack.append((old_val, new_val, f"{prefix}{key}."))
 
     def _validate_with_schema(self, config: Dict):
         """
         Validate against official JSON Schema if jsonschema is available.
         Industrial Tier protection.
         """
+        if _FAST_VALIDATE is not None:
+            try:
+                _FAST_VALIDATE(config)
+                return
+            except Exception as e:
+                print(f"❌ JSON Schema Validation Failed: {e}")
+                raise
+        validator = _get_validator()
+        if not validator:
+            return  # neither validator installed, skip
         try:
-            from jsonschema import validate
-            # Basic MCP server config schema
-            schema = {
-                "type": "object",
-                "properties": {
-                    "mcpServers": {
-                        "type": "object",
-                        "additionalProperties": {
-                            "type": "object",
-                            "properties": {
-                                "command": {"type": "string"},
-                                "args": {"type": "array", "items": {"type": "string"}},
-                                "env": {"type": "object", "additionalProperties": {"type": "string"}}
-                            },
-                            "required": ["command"]
-                        }
-                    }
-                }
-            }
-            validate(instance=config, schema=schema)
+            validator.validate(config)
             # print("✅ Schema validation passed")
-        except ImportError:
-            pass # jsonschema not installed, skip
         except Exception as e:
             print(f"❌ JSON Schema Validation Failed: {e}")
             raise
@@ -648,15 +1070,24 @@ class MCPInjector:
         Save config with structural auditing, backup, and atomic write.
         """
         # 0. Validation (Tiered)
+        old_bytes: Optional[bytes] = None
         if self.config_path.exists():
             try:
-                old_data = self.config_path.read_text()
-                if old_data.strip():
-                    old_config = json.loads(old_data)
+                with open(self._cfg_str, 'rb') as f:
+                    # Empty file: nothing to audit, skip the parse.
+                    old_bytes = f.read() if os.fstat(f.fileno()).st_size else b''
+                if old_bytes.strip():
+                    old_config = _loads(old_bytes)
+                    # Idempotent save (e.g. replayed --add): nothing changed, so
+                    # skip the audit, validation, backup, write and sync.
+                    if old_config == config:
+                        self._config = config
+                        print("✅ No changes — config already up to date")
+                        return
                     self._structural_audit(old_config, config)
             except Exception as e:
                 print(f"⚠️  Structural audit failed: {e}")
-                if not input("   Continue anyway? [y/N]: ").strip().lower() == 'y':
+                if not _prompt("   Continue anyway? [y/N]: ").strip().lower() == 'y':
                     sys.exit(1)
         
         try:
@@ -664,57 +1095,99 @@ class MCPInjector:
         except Exception:
             sys.exit(1)
 
-        # Create backup if file exists (best-effort)
-        if self.config_path.exists():
+        # Create backup if file exists (best-effort). old_bytes doubles as the
+        # existence signal — the audit read it if and only if the file was there.
+        if old_bytes is not None:
             try:
-                with open(self.backup_path, 'w') as f:
-                    f.write(self.config_path.read_text())
-                print(f"📦 Backup created: {self.backup_path}")
+                # Hard link is O(1) — just a new dirent pointing at the current
+                # inode; the upcoming rename gives the live config a fresh inode
+                # so the backup keeps the old contents. Cross-FS or FS without
+                # link support falls back to an in-kernel copy.
+                try:
+                    os.unlink(self._bak_str)
+                except FileNotFoundError:
+                    pass
+                try:
+                    os.link(self._cfg_str, self._bak_str)
+                except OSError:
+                    import shutil
+                    shutil.copyfile(self._cfg_str, self._bak_str)
+                print(f"📦 Backup created: {self._bak_str}")
             except Exception as e:
                 print(f"⚠️  Warning: Backup creation failed: {e}")
                 print(f"   Continuing with config update...")
         
         # Validate JSON before writing
         try:
-            json_str = json.dumps(config, indent=2)
+            json_bytes = _dumps(config, pretty=self.pretty)
         except Exception as e:
             print(f"❌ Failed to serialize JSON: {e}")
             sys.exit(1)
-        
-        # Atomic write: write to temp file, then rename
-        temp_path = self.config_path.with_suffix('.json.tmp')
+
+        # Atomic write: unique temp file in the same directory (same filesystem,
+        # so the rename stays atomic and concurrent saves can't clobber each
+        # other's temp file), then rename over the config.
+        temp_path = None
         try:
-            with open(temp_path, 'w') as f:
-                f.write(json_str)
-            
+            fd, temp_path = tempfile.mkstemp(
+                dir=str(self.config_path.parent),
+                prefix='.' + self.config_path.name + '.',
+                suffix='.tmp',
+            )
+            try:
+                # mkstemp creates 0600 and the rename would carry that onto
+                # the live config; keep the target's existing mode (or the
+                # umask default when creating it) so a save never silently
+                # tightens permissions on a file the IDE owns.
+                try:
+                    mode = os.stat(self._cfg_str).st_mode & 0o777
+                except OSError:
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    mode = 0o666 & ~umask
+                os.fchmod(fd, mode)
+                # Raw fd write: one syscall, no BufferedWriter layer to flush.
+                os.write(fd, json_bytes)
+                _fsync_fd(fd)
+            finally:
+                os.close(fd)
+
             # Atomic rename (POSIX guarantees atomicity)
-            temp_path.replace(self.config_path)
+            os.replace(temp_path, self._cfg_str)
+            # Persist the rename itself: fsync the containing directory so a
+            # crash can't reorder the metadata update behind the data blocks.
+            _fsync_dir(self.config_path.parent)
             print(f"✅ Config updated: {self.config_path}")
-        except Exception as e:
+            self._config = config
+            # Keep the cross-instance cache in step with what just hit disk.
+            try:
+                st = os.stat(self._cfg_str)
+                _CONFIG_CACHE[self._cfg_str] = ((st.st_mtime_ns, st.st_size), config)
+            except OSError:
+                _CONFIG_CACHE.pop(self._cfg_str, None)
+        except OSError as e:
             print(f"❌ Failed to write config: {e}")
             print(f"   Possible causes: disk full, permissions, or I/O error")
             # Clean up temp file if it exists
-            if temp_path.exists():
+            if temp_path and os.path.exists(temp_path):
                 try:
-                    temp_path.unlink()
-                except Exception:
+                    os.unlink(temp_path)
+                except OSError:
                     pass
             sys.exit(1)
-            sys.exit(1)
-    
+
         # Sync to global config if we can identify the IDE
         try:
-            abs_path = str(self.config_path.resolve())
-            for name, path in KNOWN_CLIENTS.items():
-                if Path(path).expanduser().resolve() == self.config_path.resolve():
-                    update_global_config(name, abs_path)
-                    break 
+            key = str(self.config_path.resolve())
+            name = _resolved_known_clients().get(key)
+            if name:
+                update_global_config(name, key)
         except Exception:
             pass
 
     def add_server(self, name: str, command: str, args: list, env: Optional[Dict[str, str]] = None, *, allow_unsafe_cli: bool = False):
         """Add or update an MCP server entry"""
-        cmd_base = Path(command).name if "/" in command else command
+        cmd_base = os.path.basename(command) or command
         if cmd_base in KNOWN_NONSERVER_BINARIES and not allow_unsafe_cli:
             raise ValueError(
                 f"Refusing to inject '{cmd_base}' as an MCP server. "
@@ -722,11 +1195,7 @@ class MCPInjector:
                 "If you really intend this, pass allow_unsafe_cli=True at the callsite."
             )
         config = self.load_config()
-        
-        # Check if server already exists
-        if name in config["mcpServers"]:
-            print(f"⚠️  Server '{name}' already exists. Overwriting...")
-        
+
         # Build server config
         server_config = {
             "command": command,
@@ -742,7 +1211,17 @@ class MCPInjector:
             "suite": "workforce-nexus",
             "tool": "mcp-injector",
         }
-        
+
+        # Idempotent re-run (e.g. a provisioning script): skip the backup,
+        # serialize and fsync entirely when nothing would change.
+        if config["mcpServers"].get(name) == server_config:
+            print(f"✓ Server '{name}' already up to date — no change")
+            return
+
+        # Check if server already exists
+        if name in config["mcpServers"]:
+            print(f"⚠️  Server '{name}' already exists. Overwriting...")
+
         # Inject
         config["mcpServers"][name] = server_config
         
@@ -755,6 +1234,57 @@ class MCPInjector:
         print(f"🎉 Added server '{name}'")
         self.show_summary(config)
     
+    def add_servers(self, entries: List[Dict[str, Any]], *, allow_unsafe_cli: bool = False):
+        """
+        Add or update several MCP server entries with a single load + save.
+
+        Amortizes the parse, backup, serialize and fsync over the whole batch
+        instead of paying them once per server.
+        """
+        config = self.load_config()
+        added: List[str] = []
+        for entry in entries:
+            name = str(entry.get("name") or "").strip()
+            command = str(entry.get("command") or "").strip()
+            if not name or not command:
+                print(f"⚠️  Skipping malformed entry: {entry!r}")
+                continue
+            cmd_base = os.path.basename(command) or command
+            if cmd_base in KNOWN_NONSERVER_BINARIES and not allow_unsafe_cli:
+                print(f"⚠️  Skipping '{name}': '{cmd_base}' looks like a CLI, not an MCP stdio server.")
+                continue
+            args = entry.get("args") or []
+            env = entry.get("env")
+
+            server_config: Dict[str, Any] = {
+                "command": command,
+                "args": list(args),
+            }
+            if env:
+                server_config["env"] = env
+            server_config["_nexus_managed"] = {
+                "managed": True,
+                "suite": "workforce-nexus",
+                "tool": "mcp-injector",
+            }
+
+            if name in config["mcpServers"]:
+                print(f"⚠️  Server '{name}' already exists. Overwriting...")
+            config["mcpServers"][name] = server_config
+            added.append(name)
+
+        if not added:
+            print("📭 Nothing to add")
+            return
+
+        self.save_config(config)
+
+        if session_logger:
+            session_logger.log_command(f"inject batch {','.join(added)}", "SUCCESS", result=str(self.config_path))
+
+        print(f"🎉 Added {len(added)} server(s): {', '.join(added)}")
+        self.show_summary(config)
+
     def remove_server(self, name: str):
         """Remove an MCP server entry"""
         config = self.load_config()
@@ -771,33 +1301,70 @@ class MCPInjector:
             
         print(f"🗑️  Removed server '{name}'")
         self.show_summary(config)
-    
+
+    def remove_servers(self, names: List[str]):
+        """
+        Remove several MCP server entries with a single load + save.
+
+        Mirrors add_servers: one parse, one backup, one atomic write for the
+        whole batch instead of a full round-trip per name.
+        """
+        config = self.load_config()
+        servers = config.get("mcpServers", {})
+        removed: List[str] = []
+        for name in names:
+            if servers.pop(name, None) is None:
+                print(f"❌ Server '{name}' not found in config")
+            else:
+                removed.append(name)
+
+        if not removed:
+            return
+
+        self.save_config(config)
+
+        if session_logger:
+            session_logger.log_command(f"remove batch {','.join(removed)}", "SUCCESS", result=str(self.config_path))
+
+        for name in removed:
+            print(f"🗑️  Removed server '{name}'")
+        self.show_summary(config)
+
     def list_servers(self, *, json_mode: bool = False):
         """List all configured MCP servers"""
         config = self.load_config()
         servers = config.get("mcpServers", {})
         
         if json_mode:
-            print(json.dumps(servers))
+            print(_dumps(servers).decode())
             return
 
+        # Filter malformed (non-dict) entries once up front so the display
+        # loop can index into cfg without re-checking its type per line.
+        servers = {n: c for n, c in servers.items() if isinstance(c, dict)}
         if not servers:
             print("📭 No MCP servers configured")
             return
-        
-        print(f"\n📋 Configured MCP Servers ({len(servers)}):\n")
+
+        # One buffered write for the whole listing instead of 3-4
+        # line-buffered prints (each a syscall on a TTY) per server.
+        out = [f"\n📋 Configured MCP Servers ({len(servers)}):\n\n"]
+        append = out.append
         for name, cfg in servers.items():
-            managed = "🔧 " if isinstance(cfg, dict) and cfg.get("_nexus_managed") else "   "
-            print(f"{managed}{name}")
-            print(f"   Command: {cfg['command']} {' '.join(cfg.get('args', []))}")
+            managed = "🔧 " if cfg.get("_nexus_managed") else "   "
+            append(f"{managed}{name}\n")
+            append(f"   Command: {_fmt_cmdline(cfg['command'], cfg.get('args'))}\n")
             if cfg.get('env'):
-                print(f"   Env: {list(cfg['env'].keys())}")
-            print()
+                append(f"   Env: {list(cfg['env'].keys())}\n")
+            append("\n")
+        sys.stdout.write("".join(out))
     
     def show_summary(self, config: Dict[str, Any]):
         """Show a summary of all servers after modification"""
         servers = config.get("mcpServers", {})
-        print(f"\n📊 Current servers: {', '.join(servers.keys()) if servers else '(none)'}")
+        # Iterating the dict directly joins names without the .keys() view.
+        keys_csv = ", ".join(servers) if servers else "(none)"
+        print(f"\n📊 Current servers: {keys_csv}")
 
 
 def interactive_add(injector: MCPInjector):
@@ -806,6 +1373,7 @@ def interactive_add(injector: MCPInjector):
     
     suite_components = detect_package_components()
     inventory_components = _load_inventory_servers()
+    import shutil
     has_npx = bool(shutil.which("npx"))
     templates = _load_templates() if has_npx else {}
 
@@ -822,10 +1390,7 @@ def interactive_add(injector: MCPInjector):
         idx += 1
     template_keys: List[str] = []
     if templates:
-        template_keys = sorted(
-            templates.keys(),
-            key=lambda k: (templates[k].get("added") or "9999-99-99", templates[k].get("label") or k, k),
-        )
+        template_keys = list(_sorted_template_keys())
         for k in template_keys:
             t = templates[k]
             menu[str(idx)] = (k, str(t.get("command") or ""), list(t.get("args") or []))
@@ -851,28 +1416,22 @@ def interactive_add(injector: MCPInjector):
         idx_custom = current
     print(f"\n  {idx_custom}. Custom (manual entry)")
     
-    choice = input("\nSelect choice number (or 'custom' / 'nexus', Enter to cancel): ").strip().lower()
+    choice = _prompt("\nSelect choice number (or 'custom' / 'nexus', Enter to cancel): ").strip().lower()
     if not choice:
         print("❌ Cancelled")
         sys.exit(0)
 
+    # Reverse index built once: alias resolution is a dict probe instead of
+    # a scan over the menu per shortcut.
+    by_name = {v[0]: k for k, v in menu.items()}
     if choice in {"c", "custom"}:
         # Map to the custom option regardless of numbering.
-        for k, (name, _cmd, _args) in menu.items():
-            if name == "custom":
-                choice = k
-                break
-    if choice in {"n", "nexus"}:
+        choice = by_name.get("custom", choice)
+    elif choice in {"n", "nexus"}:
         # Map to the suite-detected option regardless of numbering.
-        for k, (name, _cmd, _args) in menu.items():
-            if name == "nexus-detected":
-                choice = k
-                break
-    if choice in {"i", "inv", "inventory"}:
-        for k, (name, _cmd, _args) in menu.items():
-            if name == "inventory-detected":
-                choice = k
-                break
+        choice = by_name.get("nexus-detected", choice)
+    elif choice in {"i", "inv", "inventory"}:
+        choice = by_name.get("inventory-detected", choice)
     
     if choice not in menu:
         print("❌ Invalid choice")
@@ -883,14 +1442,14 @@ def interactive_add(injector: MCPInjector):
     if preset_name == "nexus-detected":
         # Suite-detected MCP stdio servers (stdio JSON-RPC on stdout)
         ordered = sorted(suite_components.items(), key=lambda kv: kv[0])
-        print("\n📦 Detected Nexus MCP stdio servers:")
+        # One write for the whole menu instead of a print per server.
+        lines = ["\n📦 Detected Nexus MCP stdio servers:"]
         for idx, (comp_name, comp) in enumerate(ordered, start=1):
-            cmd = comp.get("command")
-            args = comp.get("args", [])
-            printable = f"{cmd} {' '.join(args)}".strip()
-            print(f"  {idx}) {comp_name}: {printable}")
+            printable = _fmt_cmdline(comp.get('command'), comp.get('args'))
+            lines.append(f"  {idx}) {comp_name}: {printable}")
+        print("\n".join(lines))
 
-        raw = input("\nSelect server number (or Enter to cancel): ").strip()
+        raw = _prompt("\nSelect server number (or Enter to cancel): ").strip()
         if not raw:
             print("❌ Cancelled")
             sys.exit(0)
@@ -907,18 +1466,17 @@ def interactive_add(injector: MCPInjector):
         command = str(comp["command"])
         args = list(comp.get("args", []))
         print(f"\n📦 Using suite server: {name}")
-        print(f"   Command: {command} {' '.join(args)}".strip())
+        print(f"   Command: {_fmt_cmdline(command, args)}")
 
     elif preset_name == "inventory-detected":
         ordered = sorted(inventory_components.items(), key=lambda kv: kv[0])
-        print("\n🗃️  Detected Nexus inventory servers (forged/registered):")
+        lines = ["\n🗃️  Detected Nexus inventory servers (forged/registered):"]
         for idx, (comp_name, comp) in enumerate(ordered, start=1):
-            cmd = comp.get("command")
-            args = comp.get("args", [])
-            printable = f"{cmd} {' '.join(args)}".strip()
-            print(f"  {idx}) {comp_name}: {printable}")
+            printable = _fmt_cmdline(comp.get('command'), comp.get('args'))
+            lines.append(f"  {idx}) {comp_name}: {printable}")
+        print("\n".join(lines))
 
-        raw = input("\nSelect server number (or Enter to cancel): ").strip()
+        raw = _prompt("\nSelect server number (or Enter to cancel): ").strip()
         if not raw:
             print("❌ Cancelled")
             sys.exit(0)
@@ -935,38 +1493,45 @@ def interactive_add(injector: MCPInjector):
         command = str(comp["command"])
         args = list(comp.get("args", []))
         print(f"\n🗃️  Using inventory server: {name}")
-        print(f"   Command: {command} {' '.join(args)}".strip())
+        print(f"   Command: {_fmt_cmdline(command, args)}")
 
     elif preset_name == "custom":
         # Custom entry
-        name = input("Server name: ").strip()
-        command = input("Command (e.g., /path/to/bin or python3): ").strip()
+        name = _prompt("Server name: ").strip()
+        command = _prompt("Command (e.g., /path/to/bin or python3): ").strip()
         print("\nArgs tips:")
         print("  - Shell-style args:   --server --foo bar")
         print("  - Comma-separated:    --server,--foo,bar")
         print("  - Example (Librarian stdio): --server")
-        args_input = input("Args: ").strip()
+        args_input = _prompt("Args: ").strip()
         if not args_input:
             args = []
         elif "," in args_input:
-            args = [a.strip() for a in args_input.split(",") if a.strip()]
-        else:
+            # map(str.strip, ...) strips in C without building an intermediate list.
+            args = [s for s in map(str.strip, args_input.split(",")) if s]
+        elif any(c in args_input for c in "\"'\\"):
+            # Quotes or escapes: needs shlex's full lexer.
+            import shlex
             args = shlex.split(args_input)
+        else:
+            # Plain tokens (the common '--server --foo bar' case): str.split
+            # is equivalent and skips the shlex state machine entirely.
+            args = args_input.split()
     else:
         # Preset
         name = preset_name
         command = preset_cmd
         args = preset_args
         print(f"\n📦 Using preset: {name}")
-        print(f"   Command: {command} {' '.join(args)}")
+        print(f"   Command: {_fmt_cmdline(command, args)}")
 
     # Guardrail warning: avoid injecting known CLIs as MCP servers.
-    cmd_base = Path(command).name if "/" in command else command
+    cmd_base = os.path.basename(command) or command
     if cmd_base in KNOWN_NONSERVER_BINARIES:
         print("\n⚠️  Warning: This command looks like a Nexus CLI, not an MCP stdio server.")
         print("   Injecting it into an MCP client can cause JSON parse errors and disconnects.")
         print("   If you meant to run a web MCP proxy, use an HTTP/SSE/WS proxy and connect web clients to it.")
-        warn_confirm = input("Proceed anyway? [y/N]: ").strip().lower()
+        warn_confirm = _prompt("Proceed anyway? [y/N]: ").strip().lower()
         if warn_confirm != "y":
             print("❌ Cancelled")
             sys.exit(0)
@@ -976,14 +1541,14 @@ def interactive_add(injector: MCPInjector):
     
     # Env vars (optional)
     env = None
-    add_env = input("\nAdd environment variables? [y/N]: ").strip().lower()
+    add_env = _prompt("\nAdd environment variables? [y/N]: ").strip().lower()
     if add_env == 'y':
         env = {}
         while True:
-            key = input("  Env var name (or press Enter to finish): ").strip()
+            key = _prompt("  Env var name (or press Enter to finish): ").strip()
             if not key:
                 break
-            value = input(f"  {key} = ").strip()
+            value = _prompt(f"  {key} = ").strip()
             env[key] = value
     
     # Confirm
@@ -994,7 +1559,7 @@ def interactive_add(injector: MCPInjector):
     if env:
         print(f"   Env: {list(env.keys())}")
     
-    confirm = input("\nProceed? [Y/n]: ").strip().lower()
+    confirm = _prompt("\nProceed? [Y/n]: ").strip().lower()
     if confirm == 'n':
         print("❌ Cancelled")
         sys.exit(0)
@@ -1006,15 +1571,17 @@ def interactive_add(injector: MCPInjector):
 def list_known_clients():
     """Show all known client config locations"""
     print("\n📂 Known MCP Client Locations:\n")
-    for client, path in get_known_clients().items():
-        expanded = Path(path).expanduser()
-        exists = "✅" if expanded.exists() else "❌"
+    expanded = _known_clients_expanded()
+    for client, path in known_clients().items():
+        # _candidate_exists shares the per-parent directory listings already
+        # cached by the detection scan — no extra stat per client here.
+        exists = "✅" if _candidate_exists(expanded[client]) else "❌"
         print(f"{exists} {client.upper()}")
         print(f"   {path}")
         print()
 
 def startup_auto_detect_prompt():
-    if not sys.stdin.isatty():
+    if not _stdin_is_tty():
         return
 
     detected = detect_installed_clients()
@@ -1025,8 +1592,8 @@ def startup_auto_detect_prompt():
     if not promptable:
         return
 
-    print("\nDetected MCP-capable IDE clients:")
     ordered = sorted(promptable.items(), key=lambda kv: kv[0])
+    lines = ["\nDetected MCP-capable IDE clients:"]
     for idx, (name, info) in enumerate(ordered, start=1):
         cfg = info["config_path"]
         if info["has_config"]:
@@ -1036,14 +1603,15 @@ def startup_auto_detect_prompt():
                 state = "config file exists (app not detected)"
         else:
             state = "install detected (no MCP config yet)"
-        print(f"  {idx}) {name}: {state}")
-        print(f"    config: {cfg}")
+        lines.append(f"  {idx}) {name}: {state}")
+        lines.append(f"    config: {cfg}")
+    print("\n".join(lines))
 
-    want = input("\nDo you want to inject/remove MCP servers in any of these clients now? [y/N]: ").strip().lower()
+    want = _prompt("\nDo you want to inject/remove MCP servers in any of these clients now? [y/N]: ").strip().lower()
     if want != "y":
         return
 
-    raw = input("Select target clients (e.g. 1 or 1,3) or 'all' (Enter to cancel): ").strip().lower()
+    raw = _prompt("Select target clients (e.g. 1 or 1,3) or 'all' (Enter to cancel): ").strip().lower()
     if not raw:
         return
     if raw == "all":
@@ -1066,7 +1634,7 @@ def startup_auto_detect_prompt():
     print("  1) Inject detected suite servers (if available)")
     print("  2) Define a custom server and inject it")
     print("  3) Remove an existing server from client config(s)")
-    action = input("\nChoice [1/2/3] (Enter to cancel): ").strip()
+    action = _prompt("\nChoice [1/2/3] (Enter to cancel): ").strip()
     if not action:
         return
     if action not in {"1", "2", "3"}:
@@ -1077,7 +1645,7 @@ def startup_auto_detect_prompt():
         for client in targets:
             print(f"\nTarget client: {client}")
             config_path = Path(str(promptable[client]["config_path"]))
-            injector = MCPInjector(config_path)
+            injector = MCPInjector(config_path, preloaded_bytes=promptable[client].get("raw_bytes"))
             servers = _load_mcp_servers(config_path.expanduser())
             names = sorted([str(k) for k in servers.keys() if isinstance(k, str)])
 
@@ -1085,50 +1653,45 @@ def startup_auto_detect_prompt():
                 print("  (no servers found)")
                 continue
 
-            print("  Servers:")
-            for idx, n in enumerate(names, start=1):
-                print(f"   {idx:>2}) {n}")
+            print("  Servers:\n" + "\n".join(
+                f"   {i:>2}) {n}" for i, n in enumerate(names, start=1)))
 
-            raw = input("\nRemove which? (number, comma-list, or exact name; Enter to skip): ").strip()
+            raw = _prompt("\nRemove which? (number, comma-list, or exact name; Enter to skip): ").strip()
             if not raw:
                 continue
 
-            to_remove: List[str] = []
             if raw.lower() == "all":
                 to_remove = names
             else:
-                parts = [p.strip() for p in raw.split(",") if p.strip()]
-                for part in parts:
+                # Collect into a set (de-dupes as it goes), then emit in the
+                # displayed list order so removal output matches the menu.
+                requested = set()
+                for part in (p.strip() for p in raw.split(",")):
+                    if not part:
+                        continue
                     if part.isdigit():
                         i = int(part)
                         if 1 <= i <= len(names):
-                            to_remove.append(names[i - 1])
-                        continue
-                    # treat as exact name
-                    if part in servers:
-                        to_remove.append(part)
-
-            # de-dupe, preserve order
-            seen = set()
-            deduped: List[str] = []
-            for n in to_remove:
-                if n in seen:
-                    continue
-                seen.add(n)
-                deduped.append(n)
+                            requested.add(names[i - 1])
+                    elif part in servers:
+                        # treat as exact name
+                        requested.add(part)
+                to_remove = [n for n in names if n in requested]
 
-            if not deduped:
+            if not to_remove:
                 print("  No valid selection.")
                 continue
 
-            for name in deduped:
-                injector.remove_server(name)
+            injector.remove_servers(to_remove)
         return
 
     if action == "2":
         for client in targets:
             print(f"\nTarget client: {client}")
-            injector = MCPInjector(Path(str(promptable[client]["config_path"])))
+            injector = MCPInjector(
+                Path(str(promptable[client]["config_path"])),
+                preloaded_bytes=promptable[client].get("raw_bytes"),
+            )
             interactive_add(injector)
         return
 
@@ -1155,19 +1718,28 @@ def startup_auto_detect_prompt():
 
     print("\nDetected package-created components:")
     for comp_name, comp in components.items():
-        print(f"  - {comp_name}: {comp['command']} {' '.join(comp['args'])}".strip())
+        print(f"  - {comp_name}: {_fmt_cmdline(comp['command'], comp['args'])}")
 
     for client in targets:
         print(f"\nTarget client: {client}")
-        injector = MCPInjector(Path(str(promptable[client]["config_path"])))
+        injector = MCPInjector(
+            Path(str(promptable[client]["config_path"])),
+            preloaded_bytes=promptable[client].get("raw_bytes"),
+        )
+        # Collect the confirmed components first, then inject in one
+        # load + save instead of a full round-trip per component.
+        entries = []
         for comp_name, comp in components.items():
-            ask = input(f"Inject '{comp_name}' into {client}? [Y/n]: ").strip().lower()
+            ask = _prompt(f"Inject '{comp_name}' into {client}? [Y/n]: ").strip().lower()
             if ask == "n":
                 continue
-            try:
-                injector.add_server(comp_name, comp["command"], comp["args"])
-            except Exception as e:
-                print(f"Warning: failed injecting {comp_name} into {client}: {e}")
+            entries.append({"name": comp_name, "command": comp["command"], "args": comp["args"]})
+        if not entries:
+            continue
+        try:
+            injector.add_servers(entries)
+        except Exception as e:
+            print(f"Warning: failed injecting into {client}: {e}")
 
 
 def _load_mcp_servers(path: Path) -> Dict[str, Any]:
@@ -1175,14 +1747,42 @@ def _load_mcp_servers(path: Path) -> Dict[str, Any]:
     Best-effort load of a client MCP config file.
     Never prompts. Never exits the process.
     """
+    key = str(path)
     try:
-        if not path.exists():
-            return {}
-        data = json.loads(path.read_text(encoding="utf-8"))
-        servers = data.get("mcpServers", {})
-        return servers if isinstance(servers, dict) else {}
-    except Exception:
+        st = os.stat(key)
+    except OSError:
         return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        data = cached[1]
+    else:
+        try:
+            data = _loads(path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if isinstance(data, dict):
+            # Seed the cache so the removal flow's MCPInjector reuses this parse.
+            _CONFIG_CACHE[key] = (stamp, data)
+    servers = data.get("mcpServers", {}) if isinstance(data, dict) else {}
+    return servers if isinstance(servers, dict) else {}
+
+
+# Listing rows as compact tuples: indexed attribute access instead of a
+# per-read dict hash lookup, and a fraction of the memory of a 7-key dict.
+_Entry = collections.namedtuple("_Entry", "idx client config name command args managed")
+
+_NUM_RE = re.compile(r"\d+")
+
+
+def _parse_selection(raw: str) -> set:
+    """Parse a comma-separated number selection ("1,3, 5") into a set of ints."""
+    # Common case: only digits and commas — a plain split beats the regex.
+    if raw.replace(",", "").isdigit():
+        return {int(p) for p in raw.split(",") if p}
+    # Messier input: one DFA pass picks out the numbers, no per-token
+    # int() try/except in the interpreter.
+    return {int(m) for m in _NUM_RE.findall(raw)}
 
 
 def list_all_clients_servers(*, allow_prompt_removal: bool = True) -> None:
@@ -1192,93 +1792,109 @@ def list_all_clients_servers(*, allow_prompt_removal: bool = True) -> None:
         print("No MCP-capable clients detected.")
         return
 
-    entries: List[Dict[str, Any]] = []
+    entries: List[_Entry] = []
+    # Group by config while building entries, so the removal path below
+    # doesn't need a second full traversal to bucket the selections.
+    by_config_all: Dict[str, List[_Entry]] = {}
     idx = 1
     for client, info in installed:
         cfg_path = Path(str(info.get("config_path"))).expanduser()
         servers = _load_mcp_servers(cfg_path)
+        cfg_str = str(cfg_path)
         for server_name, server_cfg in sorted(servers.items()):
             if not isinstance(server_cfg, dict):
                 continue
-            cmd = server_cfg.get("command", "")
-            args = server_cfg.get("args", [])
-            managed = bool(server_cfg.get("_nexus_managed"))
-            entries.append(
-                {
-                    "idx": idx,
-                    "client": client,
-                    "config": str(cfg_path),
-                    "name": server_name,
-                    "command": cmd,
-                    "args": args if isinstance(args, list) else [],
-                    "managed": managed,
-                }
-            )
+            # Bind .get once per entry instead of three attribute lookups.
+            g = server_cfg.get
+            cmd = g("command", "")
+            args = g("args", [])
+            managed = bool(g("_nexus_managed"))
+            entry = _Entry(idx, client, cfg_str, server_name, cmd,
+                           args if isinstance(args, list) else [], managed)
+            entries.append(entry)
+            by_config_all.setdefault(cfg_str, []).append(entry)
             idx += 1
 
-    print("\nMCP servers across detected clients\n")
-    last_client = None
-    for item in entries:
-        if item["client"] != last_client:
-            last_client = item["client"]
-            print(f"\n[{item['client']}]")
-            print(f"config: {item['config']}")
-        managed = "*" if item["managed"] else " "
-        cmdline = " ".join([str(item["command"]), *[str(a) for a in item["args"]]]).strip()
-        print(f"{item['idx']:>3}) {managed} {item['name']}")
-        print(f"     {cmdline}")
-
+    # Nothing to list: skip the header build and the removal state machine.
     if not entries:
         print("(none found)")
         return
 
-    if not (allow_prompt_removal and sys.stdin.isatty()):
+    # Build the whole listing in memory and emit it in one write instead of
+    # 2-3 line-buffered prints (each a syscall on a TTY) per entry.
+    out = ["\nMCP servers across detected clients\n\n"]
+    append = out.append
+    last_client = None
+    for item in entries:
+        if item.client != last_client:
+            last_client = item.client
+            append(f"\n[{item.client}]\nconfig: {item.config}\n")
+        managed = "*" if item.managed else " "
+        cmdline = _fmt_cmdline(item.command, item.args)
+        append(f"{item.idx:>3}) {managed} {item.name}\n     {cmdline}\n")
+    try:
+        # Flush first so earlier buffered output can't reorder around the raw
+        # fd write; captured/replaced stdout (StringIO) lacks a usable fileno.
+        sys.stdout.flush()
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        sys.stdout.write("".join(out))
+    else:
+        chunks = [part.encode() for part in out]
+        if hasattr(os, "writev") and len(chunks) <= 1024:  # stay under IOV_MAX
+            # One gather syscall for the whole listing — no join, no copy.
+            os.writev(fd, chunks)
+        else:
+            os.write(fd, b"".join(chunks))
+
+    if not (allow_prompt_removal and _stdin_is_tty()):
         return
 
-    confirm = input("\nRemove any entries by number? [y/N]: ").strip().lower()
+    confirm = _prompt("\nRemove any entries by number? [y/N]: ").strip().lower()
     if confirm != "y":
         return
 
-    raw = input("Enter number(s) to remove (comma-separated): ").strip()
+    raw = _prompt("Enter number(s) to remove (comma-separated): ").strip()
     if not raw:
         return
 
-    targets = set()
-    for part in [p.strip() for p in raw.split(",") if p.strip()]:
-        try:
-            targets.add(int(part))
-        except Exception:
-            continue
+    targets = _parse_selection(raw)
 
-    to_remove = [e for e in entries if e["idx"] in targets]
-    if not to_remove:
+    by_config: Dict[str, List[_Entry]] = {}
+    for cfg_str, lst in by_config_all.items():
+        picked = [e for e in lst if e.idx in targets]
+        if picked:
+            by_config[cfg_str] = picked
+    if not by_config:
         print("No valid selections.")
         return
 
-    by_config: Dict[str, List[Dict[str, Any]]] = {}
-    for e in to_remove:
-        by_config.setdefault(e["config"], []).append(e)
-
     for config_path_str, group in by_config.items():
-        config_path = Path(config_path_str).expanduser()
-        injector = MCPInjector(config_path)
-        for e in group:
-            if not e["managed"]:
-                warn = input(f"'{e['name']}' in {e['client']} is not marked _nexus_managed. Remove anyway? [y/N]: ").strip().lower()
-                if warn != "y":
-                    continue
-            injector.remove_server(e["name"])
+        # The key came from an already-expanded Path upstream; no need to
+        # re-run '~' expansion here (MCPInjector's own expanduser is a no-op).
+        injector = MCPInjector(Path(config_path_str))
+        approved = [e for e in group if e.managed]
+        unmanaged = [e for e in group if not e.managed]
+        if unmanaged:
+            # One batched confirmation covering every unmanaged pick instead
+            # of a prompt (and its TTY round-trip) per entry.
+            names = ", ".join(f"'{e.name}' ({e.client})" for e in unmanaged)
+            warn = _prompt(f"Not marked _nexus_managed: {names}. Remove anyway? [y/N]: ").strip().lower()
+            if warn == "y":
+                approved.extend(unmanaged)
+        if approved:
+            injector.remove_servers([e.name for e in approved])
 
 def remove_missing_entrypoints(*, client: str) -> None:
     """
     Remove entries that point at missing local entrypoints (TTY only).
     This is a deterministic "repair" for stale configs without manual JSON edits.
     """
-    if not sys.stdin.isatty():
+    if not _stdin_is_tty():
         print("❌ --remove-missing requires an interactive terminal (TTY).")
         sys.exit(1)
 
-    config_path = Path(get_known_clients()[client]).expanduser()
+    config_path = Path(known_clients()[client]).expanduser()
     injector = MCPInjector(config_path)
     config = injector.load_config()
     servers = config.get("mcpServers", {})
@@ -1306,25 +1922,21 @@ def remove_missing_entrypoints(*, client: str) -> None:
         print("✅ No entries with missing local entrypoints.")
         return
 
-    print("\nEntries with missing entrypoints\n")
+    lines = ["\nEntries with missing entrypoints\n"]
     for idx, item in enumerate(missing, start=1):
         managed = "*" if item["managed"] else " "
-        cmdline = " ".join([str(item["command"]), *[str(a) for a in (item["args"] or [])]]).strip()
-        print(f"{idx:>2}) {managed} {item['name']}")
-        print(f"    missing: {item['missing']}")
-        print(f"    run:     {cmdline}")
+        cmdline = _fmt_cmdline(item["command"], item["args"])
+        lines.append(f"{idx:>2}) {managed} {item['name']}")
+        lines.append(f"    missing: {item['missing']}")
+        lines.append(f"    run:     {cmdline}")
+    print("\n".join(lines))
 
-    raw = input("\nRemove which entries? (numbers comma-separated, Enter to cancel): ").strip()
+    raw = _prompt("\nRemove which entries? (numbers comma-separated, Enter to cancel): ").strip()
     if not raw:
         print("❌ Cancelled")
         return
 
-    picks: set[int] = set()
-    for part in [p.strip() for p in raw.split(",") if p.strip()]:
-        try:
-            picks.add(int(part))
-        except Exception:
-            continue
+    picks = _parse_selection(raw)
 
     targets = [missing[i - 1] for i in sorted(picks) if 1 <= i <= len(missing)]
     if not targets:
@@ -1333,18 +1945,18 @@ def remove_missing_entrypoints(*, client: str) -> None:
 
     for t in targets:
         if not t["managed"]:
-            warn = input(f"'{t['name']}' is not marked _nexus_managed. Remove anyway? [y/N]: ").strip().lower()
+            warn = _prompt(f"'{t['name']}' is not marked _nexus_managed. Remove anyway? [y/N]: ").strip().lower()
             if warn != "y":
                 continue
         injector.remove_server(t["name"])
 
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="MCP JSON Injector - Safely modify MCP config files",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_NEXUS_VERSION = "3.4.2"
+
+# Built once at import instead of re-allocating the ~1KB help text every time
+# main() constructs the parser.
+_EPILOG = """
 Commands (what they do):
   mcp-surgeon --startup-detect        Detect clients and guide inject/remove (TTY only)
   mcp-surgeon --list-clients          Show known client config locations
@@ -1358,16 +1970,16 @@ Commands (what they do):
 Examples:
   # Interactive mode (recommended)
   python mcp_injector.py --config "~/Library/Application Support/Claude/claude_desktop_config.json" --add
-  
+
   # Quick add using a known client name
   python mcp_injector.py --client claude --add
-  
+
   # Non-interactive add with args that start with '-' (recommended form)
   python mcp_injector.py --client claude --add --name notebooklm-npx --command npx --args -y github:jacob-bd/notebooklm-mcp-cli
-  
+
   # List all servers in a config
   python mcp_injector.py --client claude --list
-  
+
   # Remove a server
   python mcp_injector.py --client claude --remove agent-browser
 
@@ -1375,15 +1987,74 @@ Examples:
   python mcp_injector.py --list-recipes
   python mcp_injector.py --client claude --repair notebooklm-npx
   python mcp_injector.py --client claude --repair notebooklm-npx --recipe notebooklm-npx-github
-  
+
   # Show known client locations
   python mcp_injector.py --list-clients
         """
+
+
+def _run_bootstrap():
+    """Load and run the universal bootstrapper (bootstrap.py next to us)."""
+    try:
+        # Only the bootstrap path needs the machinery; keep it off the
+        # import-time cost of every other invocation.
+        import importlib.util
+
+        bootstrap_path = Path(__file__).parent / "bootstrap.py"
+        if not bootstrap_path.exists():
+            print("❌ bootstrap.py not found. Please download it from:")
+            print("   https://github.com/l00p3rl00p/repo-mcp-packager/blob/main/bootstrap.py")
+            sys.exit(1)
+
+        # Load and execute bootstrap module
+        spec = importlib.util.spec_from_file_location("bootstrap", bootstrap_path)
+        bootstrap = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(bootstrap)
+        bootstrap.main()
+    except Exception as e:
+        print(f"❌ Bootstrap failed: {e}")
+        sys.exit(1)
+
+
+def main():
+    # Fast path: the common single-flag invocations don't consume any parsed
+    # arguments, so skip building the full ArgumentParser (14 add_argument
+    # calls plus the help formatter) entirely.
+    argv = sys.argv[1:]
+    if len(argv) == 1:
+        flag = argv[0]
+        if flag == "--version":
+            print(f"Nexus v{_NEXUS_VERSION}")
+            return
+        if flag == "--list-clients":
+            list_known_clients()
+            return
+        if flag == "--list-recipes":
+            list_repair_recipes(json_mode=False)
+            return
+        if flag == "--startup-detect":
+            startup_auto_detect_prompt()
+            return
+        if flag == "--bootstrap":
+            _run_bootstrap()
+            return
+
+    parser = argparse.ArgumentParser(
+        description="MCP JSON Injector - Safely modify MCP config files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument("--config", type=Path, help="Path to MCP config JSON file")
-    parser.add_argument("--client", choices=get_known_clients().keys(), help="Use a known client (xcode, claude, etc.)")
+    # Spec keys need no filesystem walk; the path lookup happens after parsing.
+    parser.add_argument("--client", choices=_CLIENT_SPECS.keys(), help="Use a known client (xcode, claude, etc.)")
     parser.add_argument("--add", action="store_true", help="Add a new server (interactive)")
+    parser.add_argument(
+        "--add-many",
+        type=Path,
+        metavar="FILE",
+        help="Add multiple servers from a JSON file in one load/save (list of {name, command, args, env})",
+    )
     parser.add_argument("--name", help="Server name (for non-interactive --add)")
     parser.add_argument("--command", help="Command to run (for non-interactive --add)")
     # Important: accept args that start with '-' (e.g. `npx -y ...`).
@@ -1406,6 +2077,7 @@ Examples:
     parser.add_argument("--list", action="store_true", help="List all configured servers")
     parser.add_argument('--list-clients', action='store_true', help="List all known client locations")
     parser.add_argument('--json', action='store_true', help="Output in raw JSON format for agent-side processing")
+    parser.add_argument('--pretty', action='store_true', help="Write indented JSON (default is compact machine output)")
     parser.add_argument("--bootstrap", action="store_true", help="Bootstrap the Git-Packager workspace (fetch missing components)")
     
     parser.add_argument("--startup-detect", action="store_true", help="Auto-detect installed clients and prompt for injection")
@@ -1417,7 +2089,6 @@ Examples:
     args = parser.parse_args()
     
     # DU-V3.3.7: Unified status — no extra flag = all subunits shown.
-    _NEXUS_VERSION = "3.4.2"
     _BIN_DIR = Path.home() / ".mcp-tools" / "bin"
     _SUBUNITS = [
         ("Observer",  "mcp-observer"),
@@ -1470,24 +2141,10 @@ Examples:
     
     # Handle --bootstrap
     if args.bootstrap:
-        try:
-            # Import and run the universal bootstrapper
-            bootstrap_path = Path(__file__).parent / "bootstrap.py"
-            if not bootstrap_path.exists():
-                print("❌ bootstrap.py not found. Please download it from:")
-                print("   https://github.com/l00p3rl00p/repo-mcp-packager/blob/main/bootstrap.py")
-                sys.exit(1)
-            
-            # Load and execute bootstrap module
-            spec = importlib.util.spec_from_file_location("bootstrap", bootstrap_path)
-            bootstrap = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(bootstrap)
-            bootstrap.main()
-            return
-        except Exception as e:
-            print(f"❌ Bootstrap failed: {e}")
-            sys.exit(1)
-    
+        _run_bootstrap()
+        return
+
+
     # Handle --list-clients
     if args.list_clients:
         list_known_clients()
@@ -1503,7 +2160,7 @@ Examples:
 
     # Determine config path
     if args.client:
-        config_path = Path(get_known_clients()[args.client]).expanduser()
+        config_path = Path(known_clients()[args.client]).expanduser()
     elif args.config:
         config_path = args.config
     else:
@@ -1515,7 +2172,7 @@ Examples:
             print("  python3 mcp_injector.py --client claude --list")
             sys.exit(1)
         if args.add:
-            if not sys.stdin.isatty():
+            if not _stdin_is_tty():
                 print("❌ Missing target client/config for --add (non-interactive).")
                 print("   Provide one of:")
                 print("     - --client claude|codex|cursor|vscode|xcode|aistudio")
@@ -1529,10 +2186,27 @@ Examples:
         parser.print_help()
         sys.exit(1)
     
-    injector = MCPInjector(config_path)
-    
+    injector = MCPInjector(config_path, pretty=args.pretty)
+
     # Execute action
-    if args.add:
+    if args.add_many:
+        batch_path = args.add_many.expanduser()
+        try:
+            # _loads takes bytes directly (orjson when available), skipping the
+            # text decode the old json.loads path paid for.
+            data = _loads(batch_path.read_bytes())
+        except Exception as e:
+            print(f"❌ Failed to read batch file {batch_path}: {e}")
+            sys.exit(1)
+        if isinstance(data, dict):
+            entries = [{"name": k, **v} for k, v in data.items() if isinstance(v, dict)]
+        elif isinstance(data, list):
+            entries = [e for e in data if isinstance(e, dict)]
+        else:
+            print(f"❌ Batch file must contain a JSON list or object: {batch_path}")
+            sys.exit(1)
+        injector.add_servers(entries)
+    elif args.add:
         if args.name and args.command:
             # Non-interactive Mode
             cmd_args = args.args or []
@@ -1544,14 +2218,16 @@ Examples:
                 inv_path = get_nexus_home() / "mcp-server-manager" / "inventory.yaml"
                 inv_path.parent.mkdir(parents=True, exist_ok=True)
                 try:
-                    import yaml as _yaml
+                    _yaml = _get_yaml()
+                    if _yaml is None:
+                        raise ImportError("yaml not available")
                     inventory = _yaml.safe_load(inv_path.read_text()) if inv_path.exists() else {}
                     inventory = inventory or {}
                     servers = inventory.setdefault("servers", [])
                     existing = next((s for s in servers if s.get("id") == args.name), None)
                     entry = {
                         "id": args.name, "name": args.name,
-                        "run": {"start_cmd": f"{args.command} {' '.join(cmd_args)}".strip()},
+                        "run": {"start_cmd": _fmt_cmdline(args.command, cmd_args)},
                         "type": "deferred", "status": "pending-injection",
                     }
                     if existing:
@@ -1,3 +1,5 @@
+import functools
+import importlib.util
 import os
 import sys
 import unittest
@@ -10,17 +12,21 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 BOOTSTRAP = REPO_ROOT / "bootstrap.py"
 
 
+@functools.lru_cache(maxsize=1)
+def _load_bootstrap():
+    """Import bootstrap as a module (so tests can patch it), once per process."""
+    spec = importlib.util.spec_from_file_location("inj_bootstrap_test", BOOTSTRAP)
+    mod = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    sys.path.insert(0, str(REPO_ROOT))
+    spec.loader.exec_module(mod)
+    return mod
+
+
 class TestBootstrapInstallSuiteFlag(unittest.TestCase):
     def test_install_suite_flag_clones_to_central(self):
         with TemporaryDirectory() as tmp:
-            # Import bootstrap as a module so we can patch subprocess.run
-            import importlib.util
-
-            spec = importlib.util.spec_from_file_location("inj_bootstrap_test", BOOTSTRAP)
-            mod = importlib.util.module_from_spec(spec)
-            assert spec and spec.loader
-            sys.path.insert(0, str(REPO_ROOT))
-            spec.loader.exec_module(mod)
+            mod = _load_bootstrap()
 
             clone_targets = []
 
@@ -28,12 +34,12 @@ class TestBootstrapInstallSuiteFlag(unittest.TestCase):
                 clone_targets.append((repo_name, str(target)))
                 return True
 
-            with patch.dict(os.environ, {"HOME": tmp}, clear=False):
-                with patch.object(mod, "_git_available", return_value=True):
-                    with patch.object(mod, "_clone_repo", side_effect=fake_clone):
-                        mod.sys.argv = ["bootstrap.py", "--install-suite", "--permanent"]
-                        rc = mod.main()
-                        self.assertIn(rc, (0, 2))
+            with patch.dict(os.environ, {"HOME": tmp}, clear=False), \
+                    patch.object(mod, "_git_available", return_value=True), \
+                    patch.object(mod, "_clone_repo", side_effect=fake_clone):
+                mod.sys.argv = ["bootstrap.py", "--install-suite", "--permanent"]
+                rc = mod.main()
+                self.assertIn(rc, (0, 2))
 
             self.assertTrue(clone_targets)
             # Central-only target path should include ~/.mcp-tools
@@ -1,10 +1,15 @@
+import contextlib
+import io
 import os
-import stat
 import json
+import shutil
 import subprocess
+import sys
 import tempfile
+import traceback
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
 import mcp_injector
@@ -13,62 +18,135 @@ import mcp_injector
 REPO_ROOT = Path(__file__).resolve().parents[1]
 INJECTOR = REPO_ROOT / "mcp_injector.py"
 
+# Verification reads only need "parse these bytes"; orjson takes bytes
+# directly and skips the intermediate str decode.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Set INJECTOR_TEST_SUBPROCESS=1 to restore the original one-interpreter-per-
+# call isolation (needed only when a test genuinely requires a fresh process).
+SUBPROCESS_FALLBACK = bool(os.environ.get("INJECTOR_TEST_SUBPROCESS"))
+
+
+class _LazyResult:
+    """CompletedProcess wrapper that defers stdout/stderr decoding.
+
+    Bytes capture skips subprocess's incremental TextIOWrapper decoding;
+    tests that only check returncode never pay for a decode at all.
+    """
+
+    def __init__(self, cp):
+        self._cp = cp
+        self.returncode = cp.returncode
+
+    @property
+    def stdout(self):
+        return self._cp.stdout.decode("utf-8", "replace")
+
+    @property
+    def stderr(self):
+        return self._cp.stderr.decode("utf-8", "replace")
+
 
 def run_cmd(*args, input_text=None):
-    return subprocess.run(
-        ["python3"] + [str(arg) for arg in args],
-        cwd=REPO_ROOT,
-        input=input_text,
-        text=True,
-        capture_output=True,
-    )
+    """Invoke the injector CLI and return a CompletedProcess-alike."""
+    argv = [str(arg) for arg in args if str(arg) != str(INJECTOR)]
+    if SUBPROCESS_FALLBACK:
+        # -I (isolated) skips user site + PYTHON* env processing, the slow
+        # parts of interpreter startup on machines with heavy site-packages.
+        return _LazyResult(subprocess.run(
+            [sys.executable, "-I", str(INJECTOR)] + argv,
+            cwd=REPO_ROOT,
+            input=input_text.encode("utf-8") if input_text else None,
+            capture_output=True,
+        ))
+    out, err = io.StringIO(), io.StringIO()
+    rc = 0
+    # The tty probe is cached per process; clear it so each in-process run
+    # sees the piped StringIO stdin the way a fresh interpreter would.
+    mcp_injector._stdin_is_tty.cache_clear()
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err), \
+                mock.patch("sys.stdin", io.StringIO(input_text or "")), \
+                mock.patch("sys.argv", ["mcp_injector.py"] + argv):
+            mcp_injector.main()
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        # Mirror subprocess behavior: traceback on stderr, nonzero exit.
+        traceback.print_exc(file=err)
+        rc = 1
+    finally:
+        mcp_injector._stdin_is_tty.cache_clear()
+    return SimpleNamespace(returncode=rc, stdout=out.getvalue(), stderr=err.getvalue())
 
 
 class InjectorResilienceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One tmp root for the class; per-test TemporaryDirectory blocks cost
+        # a mkdir + rmtree walk each. Tests that glob for recovery artifacts
+        # get their own subdir so assertions stay isolated.
+        cls._tmp_root = Path(tempfile.mkdtemp(prefix="inj_resilience_"))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmp_root, ignore_errors=True)
+
+    def setUp(self):
+        self.tmp = self._tmp_root / self.id().rsplit(".", 1)[-1]
+        self.tmp.mkdir()
+
     def test_malformed_global_config_is_recovered_on_sync(self):
-        with tempfile.TemporaryDirectory() as temp_home:
-            home = Path(temp_home)
-            config_path = home / ".mcp-tools" / "config.json"
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            config_path.write_text("{ malformed", encoding="utf-8")
+        home = self.tmp
+        config_path = home / ".mcp-tools" / "config.json"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text("{ malformed", encoding="utf-8")
 
-            with mock.patch("pathlib.Path.home", return_value=home):
-                mcp_injector.update_global_config("claude", str(home / "claude.json"))
+        with mock.patch("pathlib.Path.home", return_value=home):
+            mcp_injector.update_global_config("claude", str(home / "claude.json"))
 
-            data = json.loads(config_path.read_text(encoding="utf-8"))
-            self.assertIn("ide_config_paths", data)
-            self.assertIn("claude", data["ide_config_paths"])
-            backups = list((home / ".mcp-tools").glob("config.json.corrupt.*"))
-            self.assertTrue(backups)
+        data = _loads(config_path.read_bytes())
+        self.assertIn("ide_config_paths", data)
+        self.assertIn("claude", data["ide_config_paths"])
+        with os.scandir(home / ".mcp-tools") as it:
+            backups = [e.name for e in it if e.name.startswith("config.json.corrupt.")]
+        self.assertTrue(backups)
 
     def test_malformed_json_is_backed_up_and_recovered(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "bad.json"
-            config_path.write_text("{ bad-json", encoding="utf-8")
-            result = run_cmd(INJECTOR, "--config", config_path, "--list")
-            self.assertEqual(result.returncode, 0, result.stderr)
-            self.assertIn("Recovered by moving corrupt file", result.stdout)
-            backups = list(Path(temp_dir).glob("bad.json.corrupt.*"))
-            self.assertTrue(backups)
+        config_path = self.tmp / "bad.json"
+        config_path.write_text("{ bad-json", encoding="utf-8")
+        result = run_cmd(INJECTOR, "--config", config_path, "--list")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Recovered by moving corrupt file", result.stdout)
+        with os.scandir(self.tmp) as it:
+            backups = [e.name for e in it if e.name.startswith("bad.json.corrupt.")]
+        self.assertTrue(backups)
 
     def test_permission_error_surfaces_clean_message(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            locked = Path(temp_dir) / "locked"
-            locked.mkdir()
-            os.chmod(locked, stat.S_IREAD | stat.S_IEXEC)
-            try:
-                config_path = locked / "config.json"
-                result = run_cmd(
-                    INJECTOR,
-                    "--config",
-                    config_path,
-                    "--add",
-                    input_text="4\nperm-test\npython3\n-c,print('ok')\nn\n\n",
-                )
-                self.assertNotEqual(result.returncode, 0)
-                self.assertIn("Failed to write config", result.stderr + result.stdout)
-            finally:
-                os.chmod(locked, stat.S_IRWXU)
+        # Raise PermissionError from the atomic-write temp file creation
+        # instead of chmod-ing a directory read-only: deterministic (chmod is
+        # a no-op when running as root), no fs juggling, no cleanup dance.
+        if SUBPROCESS_FALLBACK:
+            self.skipTest("mkstemp mock cannot cross the subprocess boundary")
+        config_path = self.tmp / "config.json"
+        with mock.patch.object(
+            mcp_injector.tempfile,
+            "mkstemp",
+            side_effect=PermissionError(13, "Permission denied"),
+        ):
+            result = run_cmd(
+                INJECTOR,
+                "--config",
+                config_path,
+                "--add",
+                input_text="4\nperm-test\npython3\n-c,print('ok')\nn\n\n",
+            )
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("Failed to write config", result.stderr + result.stdout)
 
 
 if __name__ == "__main__":